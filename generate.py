@@ -1,25 +1,91 @@
+import gzip
+import hashlib
+import io
+import json
 import os
 import glob
-import markdown
 import re
-from typing import Dict, List, Tuple, Optional
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from string import Formatter
+from typing import Dict, IO, List, Tuple, Optional
+
+# 优先使用 C 实现的 cmarkgfm（libcmark-gfm），解析速度远快于纯 Python 的 markdown 库；
+# 未安装时回退到 markdown 库，保证在任何环境下都能生成
+try:
+    import cmarkgfm
+    from cmarkgfm.cmark import Options as _CmarkOptions
+except ImportError:
+    cmarkgfm = None
+    import markdown
+    # 解析器实例化会注册处理器并编译内部正则，构造一次全程复用
+    _MD_FALLBACK = markdown.Markdown(extensions=["fenced_code", "tables"])
 
 # -------------------------- 配置项 --------------------------
 INPUT_DIR = "./docs"  # MD 文件根目录（年份文件夹 → index.md + 子文件夹）
 OUTPUT_HTML = "./index.html"  # 生成的 HTML 输出路径
+MD_CACHE_DIR = "./.cache/md"  # 卡片解析结果缓存目录（按内容哈希命名）
+INDEX_HASH_PATH = "./.cache/index.hash"  # 上次生成时的输入状态聚合哈希
+MANIFEST_PATH = "./.cache/manifest.json"  # MD 路径 → (mtime, size, 解析结果) 清单，增量构建快路径
+PARSER_VERSION = "3"  # 解析逻辑版本号，参与哈希计算；解析/渲染逻辑变更时递增以失效旧缓存
 # 匹配 Markdown 列表项格式：- [显示文本](子文件夹名称)
-ORDER_LIST_PATTERN = re.compile(r'^\s*-\s*\[(.*?)\]\((.*?)\)\s*$')
+# 字节版按原始行匹配（自带首尾空白容忍，无需 strip/解码）；
+# 链接目标用 [^)] 限定避免回溯，仅捕获组在命中后解码
+ORDER_LIST_PATTERN = re.compile(rb'^[ \t]*-[ \t]*\[(.*?)\]\(([^)]*?)\)[ \t]*$')
+# 列表项开头特征，用于判断头部截断处是否仍在排序列表区内
+_ORDER_HINT_RE = re.compile(rb'^[ \t]*-[ \t]*\[')
+# 年份 index.md 头部预读大小：标题和排序列表都位于文件顶部，通常无需读全文件
+_INDEX_HEAD_BYTES = 16384
+# HTML 转义表（替换集与 html.escape 一致）：translate 在 C 层单遍扫描完成，
+# 比逐字符分支的纯 Python 转义快，用于直接内联进 HTML 的标题类字段
+_HTML_ESC = str.maketrans({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;',
+})
+# 匹配议题列表项（'- ' 开头的行），按字节多行扫描
+_TOPIC_RE = re.compile(rb'(?m)^[ \t]*-[ \t]')
+# 匹配一级标题行（第一个 '# ' 开头的行），按字节多行扫描
+_TITLE_RE = re.compile(rb'(?m)^[ \t]*#[ \t]+(.+?)[ \t]*$')
+# 卡片标题前缀 → Font Awesome 图标
+_ICON_MAP = {
+    'QEMU': 'fa-server',
+    'Kernel': 'fa-linux',
+    'Compiler': 'fa-code',
+}
 # -----------------------------------------------------------------------------
 
+@dataclass(slots=True)
+class Card:
+    """单张卡片：icon 与动画延迟在构造时算好，渲染循环只做属性读取"""
+    title: str  # 卡片标题
+    content: str  # 卡片内容（已渲染的 HTML）
+    icon: str  # Font Awesome 图标 class
+    delay: float  # 入场动画延迟（秒）
+
+    @classmethod
+    def create(cls, title: str, content: str, index: int) -> "Card":
+        icon = _ICON_MAP.get(title.partition('/')[0].strip(), 'fa-file-text-o')
+        return cls(title=title, content=content, icon=icon, delay=index * 0.1)
+
+@dataclass(slots=True)
+class YearInfo:
+    """单个年份标签页的全部信息（槽位属性访问比嵌套字典查找更快）"""
+    name: str  # 年份（文件夹名）
+    path: str  # 年份文件夹完整路径
+    tab_name: str  # 标签页名称
+    subfolder_order: List[str]  # 子文件夹顺序
+    cards: List[Card] = field(default_factory=list)  # 卡片数据（按展示顺序）
+    tab_ctx: Dict[str, str] = field(default_factory=dict)  # 标签按钮模板上下文（构造时预计算）
+
 def get_year_folders(input_dir: str) -> List[str]:
     """获取所有年份文件夹（按年份降序排序）"""
-    year_folders = []
-    for name in os.listdir(input_dir):
-        folder_path = os.path.join(input_dir, name)
-        if os.path.isdir(folder_path) and name.isdigit():  # 仅保留数字命名的年份文件夹
-            year_folders.append(folder_path)
-    # 按年份降序排序（最新年份在前）
-    return sorted(year_folders, reverse=True, key=lambda x: os.path.basename(x))
+    # os.scandir 的目录项自带类型信息，免去对每个条目的额外 stat 调用；
+    # 仅保留数字命名的年份文件夹，按年份降序排序（最新年份在前）
+    with os.scandir(input_dir) as it:
+        return sorted(
+            (e.path for e in it if e.name.isdigit() and e.is_dir(follow_symlinks=False)),
+            reverse=True, key=os.path.basename,
+        )
 
 def parse_year_index(year_folder: str) -> Tuple[str, List[str]]:
     """
@@ -39,30 +105,45 @@ def parse_year_index(year_folder: str) -> Tuple[str, List[str]]:
         return default_tab_name, default_order
 
     try:
-        with open(index_md_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+        # 标题和排序列表都在文件顶部，先只预读头部；一次性解码 + splitlines，
+        # 避免 readlines 的逐行分配。头部恰好截断且截断处仍在列表区
+        # （最后一个完整行还是列表项）时才回退补读剩余内容
+        with open(index_md_path, "rb") as f:
+            data = f.read(_INDEX_HEAD_BYTES)
+            if len(data) == _INDEX_HEAD_BYTES:
+                cut = data.rfind(b"\n")
+                last_line = data[data.rfind(b"\n", 0, cut) + 1:cut]
+                if cut < 0 or _ORDER_HINT_RE.match(last_line):
+                    data += f.read()
+                else:
+                    data = data[:cut]  # 丢弃末尾可能不完整的行
+        # 按字节逐行匹配，不解码整个文件，只解码命中的标题/链接目标
+        lines = data.splitlines()
 
         tab_name = default_tab_name  # 标签页名称（默认值）
         subfolder_order = []  # 子文件夹顺序
+        seen = set()  # 去重（保留第一次出现的顺序），边解析边判重
 
         # 解析一级标题（第一个 # 开头的行）
         title_found = False
         for line in lines:
-            line_stripped = line.strip()
-            if not title_found and line_stripped.startswith("# "):
-                tab_name = line_stripped.lstrip("# ").strip()
-                title_found = True
-                continue  # 标题行处理完，后续找列表项
+            # 两个模式都容忍首尾空白，原始字节行直接匹配，免去每行的 strip/解码
+            if not title_found:
+                m = _TITLE_RE.match(line)
+                if m:
+                    tab_name = m.group(1).decode("utf-8")
+                    title_found = True
+                    continue  # 标题行处理完，后续找列表项
 
             # 解析列表项（- [xxx](子文件夹名)）
-            match = ORDER_LIST_PATTERN.match(line_stripped)
+            match = ORDER_LIST_PATTERN.match(line)
             if match:
-                subfolder_name = match.group(2).strip()  # 提取子文件夹名称（链接目标）
-                if subfolder_name:
+                # 提取子文件夹名称（链接目标），命中后才解码
+                subfolder_name = match.group(2).strip().decode("utf-8")
+                if subfolder_name and subfolder_name not in seen:
+                    seen.add(subfolder_name)
                     subfolder_order.append(subfolder_name)
 
-        # 去重（保留第一次出现的顺序）
-        subfolder_order = list(dict.fromkeys(subfolder_order))
         print(f"成功解析 {year_name}/index.md：标签页名称='{tab_name}'，卡片顺序={subfolder_order}")
         return tab_name, subfolder_order
 
@@ -70,118 +151,132 @@ def parse_year_index(year_folder: str) -> Tuple[str, List[str]]:
         print(f"警告：解析 {year_name}/index.md 失败 - {str(e)}，使用默认标签页名称（{default_tab_name}）和排序")
         return default_tab_name, default_order
 
-def count_topics_in_md(md_path: str) -> int:
-    """统计 Markdown 文件中以 '-' 开头的列表项数量（议题数量）"""
-    try:
-        with open(md_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+def _render_md(text: str) -> str:
+    """渲染 Markdown 为 HTML：优先走 cmarkgfm（GFM 扩展覆盖围栏代码块和表格），
+    回退时使用 markdown 库的等价扩展"""
+    if cmarkgfm is not None:
+        return cmarkgfm.markdown_to_html_with_extensions(
+            text,
+            extensions=["table", "strikethrough", "autolink"],
+            options=_CmarkOptions.CMARK_OPT_UNSAFE,
+        )
+    # reset 清理上一文件的残留状态（引用定义等），比重建实例廉价得多
+    return _MD_FALLBACK.reset().convert(text)
+
+def parse_md_full(md_path: str, data: Optional[bytes] = None) -> Tuple[str, str, int]:
+    """单次扫描解析 MD 文件：返回 (一级标题, HTML 内容, 议题数)
+
+    标题提取、议题统计和正文渲染共用一份字节缓冲，文件只读一次、
+    只解码一次（可直接传入已读取的 data 避免二次打开）。
+    返回的标题已做 HTML 转义，渲染阶段可直接拼接。
+    """
+    if data is None:
+        with open(md_path, "rb") as f:
+            data = f.read()
 
-        count = 0
-        for line in lines:
-            line_stripped = line.strip()
-            # 统计以 '- ' 开头的列表项（注意有空格）
-            if line_stripped.startswith('- '):
-                count += 1
+    # 提取一级标题（第一个 # 开头的行），正文 = 去掉标题行的剩余部分
+    title = "未命名卡片"
+    body = data
+    m = _TITLE_RE.search(data)
+    if m:
+        # 标题会直接内联进卡片 HTML，在解析阶段转义一次即可随缓存复用
+        title = m.group(1).decode("utf-8").translate(_HTML_ESC)
+        body = data[:m.start()] + data[m.end():]
 
-        return count
-    except Exception as e:
-        print(f"警告：统计 {md_path} 议题数量失败 - {str(e)}")
-        return 0
+    # 统计议题数量（'- ' 开头的列表项）
+    topic_count = len(_TOPIC_RE.findall(data))
 
-def parse_md_file(md_path: str) -> Tuple[str, str]:
-    """解析 MD 文件：提取一级标题和 HTML 内容（兼容所有环境）"""
-    with open(md_path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
+    content_html = _render_md(body.decode("utf-8"))
+    return title, content_html, topic_count
 
-    # 提取一级标题（第一个 # 开头的行）
-    title = "未命名卡片"
-    content_lines = []
-    title_found = False
-    for line in lines:
-        line_stripped = line.strip()
-        if not title_found and line_stripped.startswith("# "):
-            title = line_stripped.lstrip("# ").strip()
-            title_found = True
-            continue  # 跳过标题行，不加入内容
-        content_lines.append(line)
-
-    # 仅保留 2 个最核心的非原生扩展（兼容所有 markdown 版本）
-    md_extensions = [
-        "fenced_code",
-        "tables"
-    ]
-    content_html = markdown.markdown(
-        "".join(content_lines),
-        extensions=md_extensions
-    )
-    return title, content_html
-
-def generate_html(year_data: Dict[str, Dict], total_topics: int = 0) -> str:
-    """
-    生成完整的 HTML 内容：
-    year_data 结构：{
-        "年份文件夹路径": {
-            "tab_name": "标签页名称",
-            "subfolder_order": ["子文件夹1", "子文件夹2", ...],
-            "cards": [(卡片标题, 卡片内容), ...]
-        }
-    }
-    total_topics: 所有议题的总数量
-    """
-    # 提取所有年份（按降序排序后的顺序）
-    year_folders = sorted(year_data.keys(), reverse=True, key=lambda x: os.path.basename(x))
-    if not year_folders:
-        raise ValueError("未找到任何有效年份文件夹，请检查 INPUT_DIR 配置")
+def _read_bytes(path: str) -> Optional[bytes]:
+    """读取文件全部字节（线程池工作函数）：失败时告警并返回 None"""
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError as e:
+        print(f"警告：读取 {path} 失败 - {str(e)}，跳过")
+        return None
 
-    # 计算主题领域数量（根据实际卡片数量）
-    topic_areas = sum(len(year_data[yf]["cards"]) for yf in year_folders)
+def parse_card(md_path: str, data: Optional[bytes]) -> Optional[Tuple[str, str, int]]:
+    """解析单个卡片 MD（进程池工作函数）：输入预读好的字节，返回 (标题, HTML 内容, 议题数)
 
-    # 优化标签页按钮设计
-    tab_buttons = []
-    for year_folder in year_folders:
-        year_info = year_data[year_folder]
-        year_name = os.path.basename(year_folder)
-        active_class = "tab-active" if year_folder == year_folders[0] else ""
-        year_specific_class = "year-default" if year_name == "2026" else ""
-        tab_buttons.append(f'''
+    结果按内容哈希缓存在 MD_CACHE_DIR 下，内容未变化的文件直接命中缓存，
+    跳过整个 Markdown 解析环节。读取失败（data 为 None）时返回 None。
+    """
+    if data is None:
+        return None
+    try:
+        # 缓存键 = 文件内容 + 解析逻辑版本（逻辑变更自动失效旧条目）
+        key = hashlib.blake2b(data + PARSER_VERSION.encode(), digest_size=16).hexdigest()
+        cache_path = os.path.join(MD_CACHE_DIR, f"{key}.json")
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                title, content_html, topic_count = json.load(f)
+            return title, content_html, topic_count
+        except (FileNotFoundError, ValueError):
+            pass
+
+        title, content_html, topic_count = parse_md_full(md_path, data)
+
+        os.makedirs(MD_CACHE_DIR, exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump([title, content_html, topic_count], f, ensure_ascii=False)
+
+        return title, content_html, topic_count
+    except Exception as e:
+        print(f"警告：解析 {md_path} 失败 - {str(e)}，跳过")
+        return None
+
+# -------------------------- HTML 模板 --------------------------
+# 页面静态骨架存放在独立模板文件中，按 ${插槽} 切分成若干字面量段，
+# 模块导入时读取/解析/UTF-8 编码一次；生成阶段直接写出字节段，
+# 不再对这 ~15 KB 静态内容做重复编码。
+# 插槽顺序（与模板文件保持一致）：
+#   tab_buttons_html → tab_contents_html → total_topics → topic_areas → year_top
+TEMPLATE_PATH = "./templates/index.html"
+_SLOT_RE = re.compile(r'\$\{\w+\}')
+
+def _load_template_segments(path: str) -> List[bytes]:
+    """读取页面模板并按插槽切分为预编码的字节字面量段列表"""
+    with open(path, "r", encoding="utf-8") as f:
+        return [seg.encode("utf-8") for seg in _SLOT_RE.split(f.read())]
+
+(_HTML_HEAD, _HTML_MID, _HTML_STATS_1, _HTML_STATS_2,
+ _HTML_FOOTER_1, _HTML_FOOTER_2) = _load_template_segments(TEMPLATE_PATH)
+# -----------------------------------------------------------------------------
+
+# -------------------------- 循环内片段模板 --------------------------
+# 卡片/按钮等重复片段的骨架在模块导入时构造一次，循环内仅做 format_map 占位符填充，
+# 避免每次迭代重新拼装大段 f-string
+_BTN_TMPL = '''
             <button class="tab-btn {active_class} {year_specific_class} rounded-xl text-lg md:text-xl hover:bg-blue-50" data-year="{year_name}">
-                <span class="relative z-10">{year_info["tab_name"]}</span>
+                <span class="relative z-10">{tab_name}</span>
             </button>
-        ''')
-    tab_buttons_html = "\n".join(tab_buttons)
+        '''
 
-    # 生成标签页内容（按解析后的顺序排列卡片）
-    tab_contents = []
-    for year_folder in year_folders:
-        year_info = year_data[year_folder]
-        year_name = os.path.basename(year_folder)
-        cards = year_info["cards"]
-        active_class = "" if year_folder == year_folders[0] else "hidden"
-
-        # 生成卡片 HTML（按顺序排列，增强视觉效果）
-        card_htmls = []
-        for idx, (card_title, card_content) in enumerate(cards):
-            # 为每个卡片添加不同的图标
-            icon_map = {
-                'QEMU': 'fa-server',
-                'Kernel': 'fa-linux',
-                'Compiler': 'fa-code',
-            }
-            icon_class = icon_map.get(card_title.split('/')[0].strip(), 'fa-file-text-o')
-            anim_delay = idx * 0.1
-
-            card_htmls.append(f'''
+_TAB_OPEN_TMPL = '''
+            <div class="tab-content {active_class} animate-fade-in" data-year="{year_name}">
+                <div class="grid grid-cols-1 gap-8">
+        '''
+
+_TAB_CLOSE = '''
+                </div>
+            </div>
+        '''.encode("utf-8")  # 纯静态片段，导入时一次性编码
+
+_CARD_TMPL = '''
                 <div class="bg-white rounded-2xl shadow-md border border-gray-100 p-8 card-hover group" style="animation-delay: {anim_delay}s;">
                     <!-- 卡片头部 -->
                     <div class="flex items-start gap-4 mb-6">
-                        <div class="flex-shrink-0 w-14 h-14 bg-gradient-to-br from-secondary to-accent rounded-xl flex items-center justify-center text-white text-2xl shadow-lg group-hover:scale-110 transition-transform duration-300">
+                        <div class="card-icon-box">
                             <i class="fa {icon_class}"></i>
                         </div>
                         <div class="flex-1">
-                            <h3 class="text-2xl md:text-3xl font-bold text-primary group-hover:text-secondary transition-colors duration-300">
+                            <h3 class="card-title">
                                 {card_title}
                             </h3>
-                            <div class="mt-2 h-1 w-16 bg-gradient-to-r from-secondary to-accent rounded-full group-hover:w-24 transition-all duration-300"></div>
+                            <div class="card-divider"></div>
                         </div>
                     </div>
 
@@ -190,11 +285,9 @@ def generate_html(year_data: Dict[str, Dict], total_topics: int = 0) -> str:
                         {card_content}
                     </div>
                 </div>
-            ''')
+            '''
 
-        # 处理无卡片的情况（添加精美的空状态提示）
-        if not card_htmls:
-            card_htmls.append(f'''
+_EMPTY_TMPL = '''
                 <div class="bg-gradient-to-br from-blue-50 to-gray-50 rounded-2xl shadow-md border-2 border-dashed border-gray-300 p-16 text-center">
                     <div class="max-w-md mx-auto">
                         <div class="w-24 h-24 bg-gradient-to-br from-secondary/20 to-accent/20 rounded-full flex items-center justify-center mx-auto mb-6">
@@ -211,622 +304,110 @@ def generate_html(year_data: Dict[str, Dict], total_topics: int = 0) -> str:
                         </a>
                     </div>
                 </div>
-            ''')
+            '''
+
+def _compile_emitter(func_name: str, template: str):
+    """把片段模板偏特化成直线写出函数（思路同 Jinja2 的模板编译）：
+    字面量段在编译期预编码为 bytes 常量，调用时按序 append，
+    热循环里不再有占位符查找和格式化解析"""
+    params: List[str] = []
+    body = []
+    for literal, field_name, _, _ in Formatter().parse(template):
+        if literal:
+            body.append(f"    a({literal.encode('utf-8')!r})")
+        if field_name:
+            if field_name not in params:
+                params.append(field_name)
+            body.append(f"    a(str({field_name}).encode('utf-8'))")
+    source = f"def {func_name}(a, {', '.join(params)}):\n" + "\n".join(body) + "\n"
+    namespace = {}
+    exec(compile(source, f"<{func_name}>", "exec"), namespace)
+    return namespace[func_name]
+
+_emit_card = _compile_emitter("_emit_card", _CARD_TMPL)
+# -----------------------------------------------------------------------------
 
-        # 生成标签页内容容器（优化动画和布局）
-        tab_contents.append(f'''
-            <div class="tab-content {active_class} animate-fade-in" data-year="{year_name}">
-                <div class="grid grid-cols-1 gap-8">
-                    {"".join(card_htmls)}
-                </div>
-            </div>
-        ''')
-    tab_contents_html = "\n".join(tab_contents)
-
-    # HTML 模板（优化版本 - 增强视觉效果和用户体验）
-    html_template = f'''<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="msvalidate.01" content="B936D7B6A9AB03565B05356475E91930" />
-    <title>GTOC Forum - 格维开源社区技术论坛</title>
-    <meta name="description" content="GTOC Forum 是格维开源社区发起的线上技术交流论坛，分享 QEMU/KVM、Linux Kernel、编译器等前沿技术。">
-    <script src="https://cdn.tailwindcss.com"></script>
-    <link href="https://cdn.jsdelivr.net/npm/font-awesome@4.7.0/css/font-awesome.min.css" rel="stylesheet">
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Noto+Sans+SC:wght@400;500;700;900&display=swap" rel="stylesheet">
-    <!-- 配置Tailwind自定义主题 -->
-    <script>
-        tailwind.config = {{
-            theme: {{
-                extend: {{
-                    colors: {{
-                        primary: '#0f172a',
-                        secondary: '#3b82f6',
-                        accent: '#f59e0b',
-                        dark: '#020617',
-                        lightBg: '#f8fafc',
-                    }},
-                    fontFamily: {{
-                        sans: ['Noto Sans SC', 'Inter', 'system-ui', 'sans-serif'],
-                    }},
-                    animation: {{
-                        'fade-in': 'fadeIn 0.6s ease-in-out',
-                        'slide-up': 'slideUp 0.5s ease-out',
-                        'float': 'float 3s ease-in-out infinite',
-                    }},
-                    keyframes: {{
-                        fadeIn: {{
-                            '0%': {{ opacity: '0' }},
-                            '100%': {{ opacity: '1' }},
-                        }},
-                        slideUp: {{
-                            '0%': {{ transform: 'translateY(30px)', opacity: '0' }},
-                            '100%': {{ transform: 'translateY(0)', opacity: '1' }},
-                        }},
-                        float: {{
-                            '0%, 100%': {{ transform: 'translateY(0px)' }},
-                            '50%': {{ transform: 'translateY(-10px)' }},
-                        }},
-                    }},
-                }},
-            }}
-        }}
-    </script>
-    <style type="text/tailwindcss">
-        @layer utilities {{
-            .content-auto {{
-                content-visibility: auto;
-            }}
-            .text-shadow {{
-                text-shadow: 0 2px 8px rgba(0,0,0,0.4);
-            }}
-            .text-shadow-lg {{
-                text-shadow: 0 4px 12px rgba(0,0,0,0.6);
-            }}
-            .bg-blur {{
-                backdrop-filter: blur(12px);
-            }}
-            .gradient-overlay {{
-                background: linear-gradient(135deg, rgba(15, 23, 42, 0.85) 0%, rgba(30, 41, 59, 0.75) 100%);
-            }}
-            .hero-gradient {{
-                background: linear-gradient(135deg, #0f172a 0%, #1e293b 50%, #334155 100%);
-            }}
-            .tab-active {{
-                color: theme('colors.secondary');
-                position: relative;
-            }}
-            .tab-active::after {{
-                content: '';
-                position: absolute;
-                bottom: -2px;
-                left: 50%;
-                transform: translateX(-50%);
-                width: 60%;
-                height: 3px;
-                background: linear-gradient(90deg, transparent, theme('colors.secondary'), transparent);
-                border-radius: 2px;
-                box-shadow: 0 2px 8px rgba(59, 130, 246, 0.4);
-            }}
-            /* 标签页按钮样式优化 */
-            .tab-btn {{
-                white-space: nowrap;
-                transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-                position: relative;
-                padding: 1rem 2rem;
-                font-weight: 600;
-                color: #64748b;
-            }}
-            .tab-btn:hover:not(.tab-active) {{
-                color: theme('colors.secondary');
-                transform: translateY(-2px);
-            }}
-            .tab-btn:hover:not(.tab-active)::after {{
-                content: '';
-                position: absolute;
-                bottom: -2px;
-                left: 50%;
-                transform: translateX(-50%);
-                width: 40%;
-                height: 2px;
-                background: linear-gradient(90deg, transparent, rgba(59, 130, 246, 0.5), transparent);
-                border-radius: 2px;
-            }}
-            .year-default {{
-                display: inline-block;
-                position: relative;
-            }}
-            /* 卡片悬停效果增强 */
-            .card-hover {{
-                transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-                background: linear-gradient(135deg, #ffffff 0%, #f8fafc 100%);
-                border: 1px solid #e2e8f0;
-                position: relative;
-                overflow: hidden;
-            }}
-            .card-hover::before {{
-                content: '';
-                position: absolute;
-                top: 0;
-                left: -100%;
-                width: 100%;
-                height: 100%;
-                background: linear-gradient(90deg, transparent, rgba(59, 130, 246, 0.05), transparent);
-                transition: left 0.5s ease;
-            }}
-            .card-hover:hover {{
-                transform: translateY(-8px);
-                box-shadow: 0 20px 40px -10px rgba(59, 130, 246, 0.2), 0 0 0 1px rgba(59, 130, 246, 0.1);
-                border-color: rgba(59, 130, 246, 0.3);
-            }}
-            .card-hover:hover::before {{
-                left: 100%;
-            }}
-            /* -------------- Markdown 样式优化 -------------- */
-            .card-content ul {{
-                list-style-type: none;
-                margin-left: 0;
-                margin-bottom: 1.25rem;
-                line-height: 2;
-            }}
-            .card-content ul li {{
-                position: relative;
-                padding-left: 1.75rem;
-                margin-bottom: 0.75rem;
-            }}
-            .card-content ul li::before {{
-                content: '▸';
-                position: absolute;
-                left: 0;
-                color: theme('colors.secondary');
-                font-weight: bold;
-                font-size: 1.1em;
-            }}
-            .card-content ul ul {{
-                margin-left: 1.5rem;
-                margin-top: 0.5rem;
-            }}
-            .card-content ul ul li::before {{
-                content: '◦';
-                color: theme('colors.accent');
-            }}
-            .card-content ol {{
-                list-style-type: decimal;
-                margin-left: 1.75rem;
-                margin-bottom: 1.25rem;
-                line-height: 2;
-            }}
-            .card-content li {{
-                margin-bottom: 0.75rem;
-                transition: all 0.2s ease;
-            }}
-            .card-content a {{
-                color: #3b82f6;
-                font-weight: 500;
-                text-decoration: none;
-                transition: all 0.2s ease;
-                position: relative;
-                padding-bottom: 2px;
-            }}
-            .card-content a::after {{
-                content: '';
-                position: absolute;
-                bottom: 0;
-                left: 0;
-                width: 0;
-                height: 2px;
-                background: linear-gradient(90deg, #3b82f6, #60a5fa);
-                transition: width 0.3s ease;
-            }}
-            .card-content a:hover {{
-                color: #2563eb;
-            }}
-            .card-content a:hover::after {{
-                width: 100%;
-            }}
-            .card-content strong {{
-                color: #0f172a;
-                font-weight: 700;
-                background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
-                padding: 0.1rem 0.3rem;
-                border-radius: 0.25rem;
-            }}
-            .card-content em {{
-                color: #475569;
-                font-style: italic;
-            }}
-            .card-content pre {{
-                background: linear-gradient(135deg, #f1f5f9 0%, #e2e8f0 100%);
-                padding: 1.25rem;
-                border-radius: 0.75rem;
-                margin: 1.5rem 0;
-                overflow-x: auto;
-                font-family: 'Menlo', 'Monaco', 'Consolas', monospace;
-                font-size: 0.95rem;
-                border: 1px solid #cbd5e1;
-                box-shadow: 0 2px 8px rgba(0, 0, 0, 0.05);
-            }}
-            .card-content code {{
-                background: linear-gradient(135deg, #f1f5f9 0%, #e2e8f0 100%);
-                padding: 0.25rem 0.5rem;
-                border-radius: 0.375rem;
-                font-family: 'Menlo', 'Monaco', 'Consolas', monospace;
-                font-size: 0.9rem;
-                border: 1px solid #cbd5e1;
-                color: #0f172a;
-                font-weight: 500;
-            }}
-            .card-content table {{
-                width: 100%;
-                border-collapse: collapse;
-                margin: 1.5rem 0;
-                border-radius: 0.5rem;
-                overflow: hidden;
-                box-shadow: 0 2px 8px rgba(0, 0, 0, 0.05);
-            }}
-            .card-content th, .card-content td {{
-                border: 1px solid #e2e8f0;
-                padding: 0.875rem 1.25rem;
-                text-align: left;
-            }}
-            .card-content th {{
-                background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
-                font-weight: 700;
-                color: #0f172a;
-            }}
-            .card-content tr:hover {{
-                background-color: #f8fafc;
-                transition: background-color 0.2s ease;
-            }}
-            .card-content img {{
-                max-width: 100%;
-                height: auto;
-                border-radius: 0.75rem;
-                margin: 1.5rem 0;
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-                transition: transform 0.3s ease, box-shadow 0.3s ease;
-            }}
-            .card-content img:hover {{
-                transform: scale(1.02);
-                box-shadow: 0 8px 24px rgba(0, 0, 0, 0.15);
-            }}
-            .card-content blockquote {{
-                border-left: 4px solid #3b82f6;
-                padding: 1rem 1.5rem;
-                background: linear-gradient(135deg, #eff6ff 0%, #dbeafe 100%);
-                margin: 1.5rem 0;
-                border-radius: 0 0.5rem 0.5rem 0;
-                box-shadow: 0 2px 8px rgba(59, 130, 246, 0.1);
-                font-style: italic;
-                color: #1e293b;
-            }}
-            /* 页脚强制显示样式 */
-            .footer-force-visible {{
-                display: block !important;
-                position: relative !important;
-                z-index: 999 !important;
-                opacity: 1 !important;
-                visibility: visible !important;
-            }}
-        }}
-    </style>
-</head>
-<body class="font-sans text-gray-800 antialiased">
-    <!-- 全屏图片区域 - 增强视觉效果 -->
-    <header class="relative h-screen w-full overflow-hidden">
-        <!-- 背景图片层 -->
-        <div class="absolute inset-0 z-0">
-            <img src="https://github.com/gevico/gtoc-forum/blob/main/asserts/head.png?raw=true"
-                 alt="GTOC Forum 背景"
-                 class="w-full h-full object-cover scale-105 animate-[zoom_20s_ease-in-out_infinite_alternate]"
-                 loading="eager">
-            <!-- 多层渐变叠加 -->
-            <div class="absolute inset-0 gradient-overlay"></div>
-            <div class="absolute inset-0 bg-gradient-to-b from-transparent via-transparent to-dark/30"></div>
-        </div>
-
-        <!-- 装饰性几何元素 -->
-        <div class="absolute inset-0 z-0 opacity-10">
-            <div class="absolute top-20 left-10 w-72 h-72 bg-secondary rounded-full mix-blend-multiply filter blur-3xl animate-float"></div>
-            <div class="absolute top-40 right-10 w-72 h-72 bg-accent rounded-full mix-blend-multiply filter blur-3xl animate-float" style="animation-delay: 2s;"></div>
-            <div class="absolute bottom-20 left-1/3 w-72 h-72 bg-secondary rounded-full mix-blend-multiply filter blur-3xl animate-float" style="animation-delay: 4s;"></div>
-        </div>
-
-        <!-- 标题区域 - 增强动画效果 -->
-        <div class="absolute inset-0 flex items-center justify-center z-10 text-center px-4">
-            <div class="max-w-4xl mx-auto animate-fade-in">
-                <!-- 主标题 -->
-                <div class="mb-8">
-                    <h1 class="text-[clamp(3rem,10vw,5.5rem)] font-black text-white text-shadow-lg mb-4 leading-tight tracking-tight">
-                        GTOC <span class="text-transparent bg-clip-text bg-gradient-to-r from-secondary to-accent">Forum</span>
-                    </h1>
-                    <div class="flex items-center justify-center gap-3 mb-4">
-                        <div class="h-px w-16 bg-gradient-to-r from-transparent to-secondary"></div>
-                        <span class="text-2xl md:text-3xl font-bold text-secondary">2026</span>
-                        <div class="h-px w-16 bg-gradient-to-l from-transparent to-secondary"></div>
-                    </div>
-                </div>
+def render_html(out: IO[bytes], years: List[YearInfo], total_topics: int = 0) -> None:
+    """
+    生成完整的 HTML 内容并流式写入 out（二进制可写对象）：
+    years: 已按年份降序排好的 YearInfo 列表（驱动层排序一次，此处直接复用）
+    total_topics: 所有议题的总数量
+    """
+    if not years:
+        raise ValueError("未找到任何有效年份文件夹，请检查 INPUT_DIR 配置")
 
-                <!-- 副标题 -->
-                <p class="text-[clamp(1.1rem,3vw,1.5rem)] text-white/90 text-shadow max-w-2xl mx-auto mb-10 leading-relaxed font-medium">
-                    格维开源社区 · 线上技术交流论坛
-                </p>
-
-                <!-- 特色标签 -->
-                <div class="flex flex-wrap justify-center gap-3 mb-8">
-                    <span class="px-4 py-2 bg-white/10 backdrop-blur-md rounded-full text-white text-sm font-medium border border-white/20 hover:bg-white/20 transition-all">
-                        <i class="fa-solid fa-server mr-2"></i>AI Infra
-                    </span>
-                    <span class="px-4 py-2 bg-white/10 backdrop-blur-md rounded-full text-white text-sm font-medium border border-white/20 hover:bg-white/20 transition-all">
-                        <i class="fa fa-code mr-2"></i>QEMU/KVM
-                    </span>
-                    <span class="px-4 py-2 bg-white/10 backdrop-blur-md rounded-full text-white text-sm font-medium border border-white/20 hover:bg-white/20 transition-all">
-                        <i class="fa fa-linux mr-2"></i>Linux Kernel
-                    </span>
-                    <span class="px-4 py-2 bg-white/10 backdrop-blur-md rounded-full text-white text-sm font-medium border border-white/20 hover:bg-white/20 transition-all">
-                        <i class="fa fa-cogs mr-2"></i>Compiler
-                    </span>
-                </div>
-            </div>
-        </div>
-
-        <!-- 向下滚动指示 - 居中布局 -->
-        <div class="absolute bottom-12 left-0 right-0 z-10 flex justify-center">
-            <a href="#forum-archive"
-               class="text-white text-5xl opacity-70 hover:opacity-100 transition-all animate-bounce hover:scale-110">
-                <i class="fa fa-angle-double-down"></i>
-            </a>
-        </div>
-    </header>
-    <!-- 内容区域 - 优化布局和视觉效果 -->
-    <section id="forum-archive" class="py-16 bg-gradient-to-b from-lightBg via-white to-lightBg">
-        <div class="container mx-auto px-4">
-            <!-- 区域标题 -->
-            <div class="max-w-5xl mx-auto mb-12 text-center animate-slide-up">
-                <h2 class="text-4xl md:text-5xl font-bold text-primary mb-4">
-                    <i class="fa fa-calendar-o mr-3 text-secondary"></i>往期分享
-                </h2>
-                <p class="text-lg text-gray-600 max-w-2xl mx-auto">
-                    探索往期技术分享，涵盖人工智能、内核、编译器、虚拟化等前沿主题
-                </p>
-                <div class="mt-6 flex justify-center">
-                    <div class="h-1 w-24 bg-gradient-to-r from-secondary to-accent rounded-full"></div>
-                </div>
-            </div>
+    # 计算主题领域数量（根据实际卡片数量）
+    topic_areas = sum(len(y.cards) for y in years)
 
-            <!-- 标签页导航容器 - 优化设计 -->
-            <div class="max-w-5xl mx-auto mb-10">
-                <div class="bg-white rounded-2xl shadow-lg border border-gray-100 p-2 animate-slide-up" style="animation-delay: 0.1s;">
-                    <div class="flex flex-wrap justify-center gap-2">
-                        {tab_buttons_html}
-                    </div>
-                </div>
-            </div>
+    # 静态字节段直接写出，动态片段编码后写出；全程不拼装整页字符串，
+    # 峰值内存与卡片数量无关
+    def w(fragment: str) -> None:
+        out.write(fragment.encode("utf-8"))
 
-            <!-- 标签页内容 - 增强卡片效果 -->
-            <div class="max-w-5xl mx-auto mb-12 animate-slide-up" style="animation-delay: 0.2s;">
-                {tab_contents_html}
-            </div>
+    out.write(_HTML_HEAD)
 
-            <!-- 说明文字 - 重新设计 -->
-            <div class="max-w-5xl mx-auto mb-12 animate-slide-up" style="animation-delay: 0.3s;">
-                <div class="relative bg-gradient-to-br from-blue-50 via-white to-amber-50 p-8 rounded-2xl border-2 border-blue-100 shadow-lg overflow-hidden">
-                    <!-- 装饰性背景 -->
-                    <div class="absolute top-0 right-0 w-64 h-64 bg-secondary/5 rounded-full blur-3xl -mr-32 -mt-32"></div>
-                    <div class="absolute bottom-0 left-0 w-64 h-64 bg-accent/5 rounded-full blur-3xl -ml-32 -mb-32"></div>
-
-                    <div class="relative z-10">
-                        <div class="flex items-start gap-4 mb-4">
-                            <div class="flex-shrink-0 w-12 h-12 bg-gradient-to-br from-secondary to-accent rounded-xl flex items-center justify-center text-white text-xl shadow-lg">
-                                <i class="fa fa-info-circle"></i>
-                            </div>
-                            <div class="flex-1">
-                                <h3 class="text-xl font-bold text-primary mb-2">关于 GTOC Forum</h3>
-                                <p class="text-base text-gray-700 leading-relaxed text-justify">
-                                    GTOC Forum 是由社区成员牵头发起的线上技术交流论坛，不定期开展技术分享会。社区成员如果有感兴趣或者想要申报议题，可以通过
-                                    <a href="https://github.com/gevico/gtoc-forum/issues"
-                                       target="_blank"
-                                       rel="noopener noreferrer"
-                                       class="inline-flex items-center gap-1 text-secondary hover:text-primary font-semibold transition-all hover:gap-2">
-                                        <i class="fa fa-github"></i>
-                                        <span>Github 仓库的 issues</span>
-                                        <i class="fa fa-external-link text-xs"></i>
-                                    </a>
-                                    页面发起讨论和申请。
-                                </p>
-                            </div>
-                        </div>
+    # 标签页按钮（上下文已在 YearInfo 构造时备好：单次生成器遍历 + 一次 join）
+    w("\n".join(_BTN_TMPL.format_map(y.tab_ctx) for y in years))
 
-                        <!-- 统计信息 -->
-                        <div class="grid grid-cols-3 gap-4 mt-6 pt-6 border-t border-gray-200">
-                            <div class="text-center">
-                                <div class="text-2xl font-bold text-secondary mb-1">{total_topics}</div>
-                                <div class="text-sm text-gray-600">技术分享</div>
-                            </div>
-                            <div class="text-center">
-                                <div class="text-2xl font-bold text-secondary mb-1">{topic_areas}</div>
-                                <div class="text-sm text-gray-600">主题领域</div>
-                            </div>
-                            <div class="text-center">
-                                <div class="text-2xl font-bold text-secondary mb-1">3600+</div>
-                                <div class="text-sm text-gray-600">社区成员</div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </section>
-    <!-- 页脚 - 现代化设计 -->
-    <footer class="hero-gradient text-white py-16 footer-force-visible relative overflow-hidden">
-        <!-- 装饰性背景 -->
-        <div class="absolute inset-0 opacity-5">
-            <div class="absolute top-0 left-0 w-96 h-96 bg-secondary rounded-full mix-blend-multiply filter blur-3xl"></div>
-            <div class="absolute bottom-0 right-0 w-96 h-96 bg-accent rounded-full mix-blend-multiply filter blur-3xl"></div>
-        </div>
-
-        <div class="container mx-auto px-4 relative z-10">
-            <div class="max-w-5xl mx-auto">
-                <!-- 社交链接 -->
-                <div class="mb-10">
-                    <h3 class="text-center text-lg font-semibold text-white/80 mb-6 tracking-wide">关注我们</h3>
-                    <div class="flex flex-wrap justify-center gap-4">
-                        <a href="https://github.com/gevico"
-                           target="_blank"
-                           rel="noopener noreferrer"
-                           class="group flex items-center gap-3 px-6 py-3 bg-white/10 hover:bg-white/20 backdrop-blur-md rounded-xl transition-all duration-300 hover:scale-105 hover:shadow-lg border border-white/20">
-                            <i class="fa fa-github text-2xl group-hover:scale-110 transition-transform"></i>
-                            <span class="font-medium">Github</span>
-                        </a>
-                        <a href="https://space.bilibili.com/483048140/lists/6433029?type=season"
-                           target="_blank"
-                           rel="noopener noreferrer"
-                           class="group flex items-center gap-3 px-6 py-3 bg-white/10 hover:bg-white/20 backdrop-blur-md rounded-xl transition-all duration-300 hover:scale-105 hover:shadow-lg border border-white/20">
-                            <i class="fa fa-youtube-play text-2xl group-hover:scale-110 transition-transform"></i>
-                            <span class="font-medium">Bilibili</span>
-                        </a>
-                        <a href="https://qm.qq.com/q/jIXYyZkQqQ"
-                           target="_blank"
-                           rel="noopener noreferrer"
-                           class="group flex items-center gap-3 px-6 py-3 bg-white/10 hover:bg-white/20 backdrop-blur-md rounded-xl transition-all duration-300 hover:scale-105 hover:shadow-lg border border-white/20">
-                            <i class="fa fa-qq text-2xl group-hover:scale-110 transition-transform"></i>
-                            <span class="font-medium">QQ Group</span>
-                        </a>
-                        <a href="https://t.me/gevico_channel"
-                           target="_blank"
-                           rel="noopener noreferrer"
-                           class="group flex items-center gap-3 px-6 py-3 bg-white/10 hover:bg-white/20 backdrop-blur-md rounded-xl transition-all duration-300 hover:scale-105 hover:shadow-lg border border-white/20">
-                            <i class="fa fa-telegram text-2xl group-hover:scale-110 transition-transform"></i>
-                            <span class="font-medium">Telegram</span>
-                        </a>
-                    </div>
-                </div>
+    out.write(_HTML_MID)
 
-                <!-- 分隔线 -->
-                <div class="mb-8">
-                    <div class="h-px bg-gradient-to-r from-transparent via-white/30 to-transparent"></div>
-                </div>
+    # 标签页内容（按解析后的顺序排列卡片）
+    for year in years:
+        cards = year.cards
+        active_class = "" if year is years[0] else "hidden"
 
-                <!-- 版权信息 -->
-                <div class="text-center">
-                    <p class="text-white/70 text-sm mb-2 flex items-center justify-center gap-2">
-                        <i class="fa fa-copyright"></i>
-                        <span>{os.path.basename(year_folders[0])} 格维开源社区. 保留所有权利.</span>
-                    </p>
-                    <p class="text-white/50 text-xs flex items-center justify-center gap-2">
-                        <i class="fa fa-heart text-red-400"></i>
-                        <span>用心打造开源技术社区</span>
-                    </p>
-                </div>
-            </div>
-        </div>
-    </footer>
-    <!-- JavaScript - 增强交互功能 -->
-    <script>
-        // 标签页切换功能（增强动画）
-        const tabBtns = document.querySelectorAll('.tab-btn');
-        const tabContents = document.querySelectorAll('.tab-content');
-
-        tabBtns.forEach(btn => {{
-            btn.addEventListener('click', () => {{
-                const targetYear = btn.getAttribute('data-year');
-
-                // 切换标签激活状态
-                tabBtns.forEach(b => b.classList.remove('tab-active'));
-                btn.classList.add('tab-active');
-
-                // 切换内容显示（添加淡入动画）
-                tabContents.forEach(content => {{
-                    if (content.getAttribute('data-year') === targetYear) {{
-                        content.classList.remove('hidden');
-                        // 重新触发动画
-                        content.style.animation = 'none';
-                        setTimeout(() => {{
-                            content.style.animation = '';
-                        }}, 10);
-                    }} else {{
-                        content.classList.add('hidden');
-                    }}
-                }});
-            }});
-        }});
-
-        // 平滑滚动
-        document.querySelectorAll('a[href^="#"]').forEach(anchor => {{
-            anchor.addEventListener('click', function (e) {{
-                e.preventDefault();
-                const targetId = this.getAttribute('href');
-                const targetElement = document.querySelector(targetId);
-                if (targetElement) {{
-                    targetElement.scrollIntoView({{
-                        behavior: 'smooth',
-                        block: 'start'
-                    }});
-                }}
-            }});
-        }});
-
-        // 滚动动画效果
-        const observerOptions = {{
-            threshold: 0.1,
-            rootMargin: '0px 0px -100px 0px'
-        }};
-
-        const observer = new IntersectionObserver((entries) => {{
-            entries.forEach(entry => {{
-                if (entry.isIntersecting) {{
-                    entry.target.style.opacity = '1';
-                    entry.target.style.transform = 'translateY(0)';
-                }}
-            }});
-        }}, observerOptions);
-
-        // 监听所有卡片元素
-        document.addEventListener('DOMContentLoaded', () => {{
-            const cards = document.querySelectorAll('.card-hover');
-            cards.forEach(card => {{
-                card.style.opacity = '0';
-                card.style.transform = 'translateY(30px)';
-                card.style.transition = 'opacity 0.6s ease, transform 0.6s ease';
-                observer.observe(card);
-            }});
-        }});
-
-        // 确保页面加载完成后页脚可见
-        window.addEventListener('load', function() {{
-            const footer = document.querySelector('footer');
-            if (footer) {{
-                footer.style.display = 'block';
-                footer.style.opacity = '1';
-                footer.offsetHeight;
-            }}
-        }});
-
-        // 添加滚动进度指示器
-        window.addEventListener('scroll', () => {{
-            const winScroll = document.body.scrollTop || document.documentElement.scrollTop;
-            const height = document.documentElement.scrollHeight - document.documentElement.clientHeight;
-            const scrolled = (winScroll / height) * 100;
-
-            // 可以在这里添加滚动进度条（如果需要）
-        }});
-
-        // 添加 CSS 动画类
-        const style = document.createElement('style');
-        style.textContent = `
-            @keyframes zoom {{
-                0%, 100% {{ transform: scale(1); }}
-                50% {{ transform: scale(1.05); }}
-            }}
-        `;
-        document.head.appendChild(style);
-    </script>
-</body>
-</html>'''
-    return html_template
+        w(_TAB_OPEN_TMPL.format_map({
+            "active_class": active_class,
+            "year_name": year.name,
+        }))
+
+        # 卡片 HTML（按顺序排列，增强视觉效果），走编译好的直线写出函数
+        for card in cards:
+            _emit_card(out.write, anim_delay=card.delay, icon_class=card.icon,
+                       card_title=card.title, card_content=card.content)
+
+        # 处理无卡片的情况（添加精美的空状态提示）
+        if not cards:
+            w(_EMPTY_TMPL.format_map({"year_name": year.name}))
+
+        out.write(_TAB_CLOSE)
+
+    # 统计信息与页脚（静态段之间填入动态数值）
+    out.write(_HTML_STATS_1)
+    w(str(total_topics))
+    out.write(_HTML_STATS_2)
+    w(str(topic_areas))
+    out.write(_HTML_FOOTER_1)
+    w(years[0].name)
+    out.write(_HTML_FOOTER_2)
+
+def _input_state_hash() -> str:
+    """聚合所有输入文件的 (路径, mtime, size) 计算哈希，用于判断输入整体是否有变化
+
+    只做一轮 os.scandir 扫描（目录项自带缓存的 stat 信息），不读取任何文件内容。
+    """
+    h = hashlib.blake2b(PARSER_VERSION.encode(), digest_size=16)
+    entries = []
+    stack = [INPUT_DIR]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    st = entry.stat()
+                    entries.append((entry.path, st.st_mtime_ns, st.st_size))
+    # 模板文件同样参与判断，模板改动后也要重新生成
+    try:
+        st = os.stat(TEMPLATE_PATH)
+        entries.append((TEMPLATE_PATH, st.st_mtime_ns, st.st_size))
+    except FileNotFoundError:
+        pass
+    for item in sorted(entries):
+        h.update(repr(item).encode())
+    return h.hexdigest()
 
 def main():
     # 1. 检查输入目录是否存在
@@ -834,77 +415,167 @@ def main():
         print(f"错误：输入目录 {INPUT_DIR} 不存在，请创建后重试")
         return
 
-    # 2. 获取所有年份文件夹（完整路径）
+    # 2. 输入未变化且输出已存在时直接跳过（整个流水线退化为一次 stat 扫描）；
+    #    传入 --force 可绕过该检查强制重新生成
+    state_hash = _input_state_hash()
+    try:
+        with open(INDEX_HASH_PATH, "r", encoding="utf-8") as f:
+            last_hash = f.read().strip()
+    except FileNotFoundError:
+        last_hash = ""
+    if state_hash == last_hash and "--force" not in sys.argv \
+            and os.path.exists(OUTPUT_HTML):
+        print(f"输入未变化，{OUTPUT_HTML} 已是最新，跳过生成")
+        return
+
+    # 3. 获取所有年份文件夹（完整路径）
     year_folders = get_year_folders(INPUT_DIR)
     if not year_folders:
         print(f"警告：输入目录 {INPUT_DIR} 下未找到任何数字命名的年份文件夹（如 2025）")
         return
 
-    # 3. 解析每个年份的 index.md 和子文件夹
-    year_data = {}  # 存储每个年份的所有信息
+    # 4. 解析每个年份的 index.md 和子文件夹
+    years = []  # 有序的 YearInfo 列表（get_year_folders 已按年份降序排好）
     total_topics = 0  # 统计所有议题总数
+    tasks = []  # 待解析的卡片任务 [(YearInfo, 子文件夹名, MD 路径), ...]
 
     for year_folder in year_folders:
         year_name = os.path.basename(year_folder)
-        year_data[year_folder] = {
-            "tab_name": "",       # 标签页名称
-            "subfolder_order": [],# 子文件夹顺序
-            "cards": []           # 卡片数据 [(标题, 内容), ...]
-        }
 
-        # 3.1 解析年份文件夹下的 index.md（获取标签页名称和子文件夹顺序）
+        # 4.1 解析年份文件夹下的 index.md（获取标签页名称和子文件夹顺序）
         tab_name, subfolder_order = parse_year_index(year_folder)
-        year_data[year_folder]["tab_name"] = tab_name
-        year_data[year_folder]["subfolder_order"] = subfolder_order
-
-        # 3.2 获取年份文件夹下的所有有效子文件夹（非隐藏）
-        all_subfolders = []
-        for item in os.scandir(year_folder):
-            if item.is_dir() and not item.name.startswith('.'):
-                all_subfolders.append(item.name)  # 存储子文件夹名称
-
-        # 3.3 按解析的顺序排列子文件夹（不存在的子文件夹跳过，剩余的按原顺序补充）
-        ordered_subfolders = []
-        # 先添加 index.md 中指定的子文件夹（存在的才添加）
+        year = YearInfo(name=year_name, path=year_folder,
+                        tab_name=tab_name, subfolder_order=subfolder_order)
+        year.tab_ctx = {
+            "active_class": "tab-active" if not years else "",  # 首个年份默认激活
+            "year_specific_class": "year-default" if year_name == "2026" else "",
+            "year_name": year_name,
+            "tab_name": tab_name.translate(_HTML_ESC),  # 来自 index.md 的标题，内联前转义
+        }
+        years.append(year)
+
+        # 4.2 获取年份文件夹下的所有有效子文件夹（非隐藏）
+        # 直接复用 DirEntry 缓存的 name/path，避免后续再拼路径或补 stat
+        subfolder_paths = {}  # 子文件夹名称 → 完整路径
+        with os.scandir(year_folder) as it:
+            for item in it:
+                if item.is_dir(follow_symlinks=False) and not item.name.startswith('.'):
+                    subfolder_paths[item.name] = item.path
+
+        # 4.3 按解析的顺序排列子文件夹（不存在的子文件夹跳过，剩余的按名称排序补充）
+        # 基于集合判重，避免在循环中对列表做 O(n) 的 remove
+        ordered_subfolders = [sf for sf in subfolder_order if sf in subfolder_paths]
         for sf in subfolder_order:
-            if sf in all_subfolders:
-                ordered_subfolders.append(sf)
-                all_subfolders.remove(sf)  # 避免重复
-            else:
+            if sf not in subfolder_paths:
                 print(f"警告：年份 {year_name} 的 index.md 中指定的子文件夹 '{sf}' 不存在，跳过")
-        # 剩余的子文件夹按名称排序补充到后面
-        ordered_subfolders += sorted(all_subfolders)
+        ordered_subfolders += sorted(subfolder_paths.keys() - set(subfolder_order))
 
-        # 3.4 解析每个有序子文件夹下的 index.md
+        # 4.4 收集每个有序子文件夹下的 index.md 解析任务
         for sf_name in ordered_subfolders:
-            sf_path = os.path.join(year_folder, sf_name)
-            index_md_path = os.path.join(sf_path, "index.md")
+            index_md_path = os.path.join(subfolder_paths[sf_name], "index.md")
 
             # 检查子文件夹下是否有 index.md
             if not os.path.exists(index_md_path):
                 print(f"警告：子文件夹 {year_name}/{sf_name} 下未找到 index.md，跳过")
                 continue
 
-            # 解析子文件夹的 index.md
-            try:
-                card_title, card_content = parse_md_file(index_md_path)
-                year_data[year_folder]["cards"].append((card_title, card_content))
+            tasks.append((year, sf_name, index_md_path))
 
-                # 统计该文件中的议题数量
-                topic_count = count_topics_in_md(index_md_path)
-                total_topics += topic_count
-
-                print(f"成功解析：{year_name}/{sf_name}/index.md → 卡片标题：{card_title}，议题数：{topic_count}")
-            except Exception as e:
-                print(f"警告：解析 {year_name}/{sf_name}/index.md 失败 - {str(e)}，跳过")
-
-    # 4. 生成 HTML 并保存
+    # 5. 解析所有卡片 MD：
+    #    5.1 先查 (mtime, size) 清单，未变化的文件连读取都跳过；
+    #    5.2 其余文件线程池批量读（小文件众多，重叠 I/O 等待），
+    #        再把字节交给进程池做 CPU 密集的解析；
+    #    5.3 最后按任务收集顺序回填 cards，保证卡片顺序与 index.md 中声明的一致
     try:
-        html_content = generate_html(year_data, total_topics)
-        with open(OUTPUT_HTML, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        manifest = {}
+    # 解析逻辑版本变化时整体废弃清单（mtime/size 未变也不能复用旧解析结果）
+    if manifest.pop("__version__", None) != PARSER_VERSION:
+        manifest = {}
+
+    results_by_path = {}  # MD 路径 → (标题, HTML 内容, 议题数)
+    pending = []  # 清单未命中、需要真正解析的任务
+    stats_by_path = {}
+    for year, sf_name, md_path in tasks:
+        try:
+            st = os.stat(md_path)
+        except OSError:
+            pending.append((year, sf_name, md_path))
+            continue
+        stats_by_path[md_path] = st
+        entry = manifest.get(md_path)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            results_by_path[md_path] = tuple(entry[2:])
+        else:
+            pending.append((year, sf_name, md_path))
+
+    if pending:
+        md_paths = [t[2] for t in pending]
+        with ThreadPoolExecutor(max_workers=32) as reader:
+            raw_contents = list(reader.map(_read_bytes, md_paths))
+        # 待解析文件很少时，进程池的启动/序列化开销超过并行收益，直接串行解析
+        if len(md_paths) < 8:
+            parsed = list(map(parse_card, md_paths, raw_contents))
+        else:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                parsed = list(executor.map(
+                    parse_card, md_paths, raw_contents, chunksize=8))
+        for md_path, result in zip(md_paths, parsed):
+            if result is None:
+                continue
+            results_by_path[md_path] = result
+            st = stats_by_path.get(md_path)
+            if st is not None:
+                manifest[md_path] = [st.st_mtime_ns, st.st_size, *result]
+
+    for year, sf_name, md_path in tasks:
+        result = results_by_path.get(md_path)
+        if result is None:
+            continue
+        card_title, card_content, topic_count = result
+        year.cards.append(Card.create(card_title, card_content, len(year.cards)))
+        total_topics += topic_count
+        print(f"成功解析：{year.name}/{sf_name}/index.md → 卡片标题：{card_title}，议题数：{topic_count}")
+
+    # 回写清单（仅保留本次出现的文件，自动清理已删除条目）
+    manifest = {p: manifest[p] for p in results_by_path if p in manifest}
+    manifest["__version__"] = PARSER_VERSION
+    os.makedirs(os.path.dirname(MANIFEST_PATH), exist_ok=True)
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+
+    # 6. 生成 HTML 并保存（内容与磁盘上的完全一致时跳过写入，
+    #    避免无谓刷新 mtime 触发下游部署/缓存失效）
+    try:
+        # 渲染到内存缓冲：render_html 按片段流式写入，主流程保留整体字节
+        # 以便与磁盘现有内容比较（也可直接传入打开的文件对象流式落盘）
+        out_buf = io.BytesIO()
+        render_html(out_buf, years, total_topics)
+        html_bytes = out_buf.getvalue()
+        try:
+            with open(OUTPUT_HTML, "rb") as f:
+                old_bytes = f.read()
+        except FileNotFoundError:
+            old_bytes = None
+        if html_bytes != old_bytes:
+            with open(OUTPUT_HTML, "wb") as f:
+                f.write(html_bytes)
+        # 同步产出预压缩文件，静态服务器可直接下发，省去每次请求的运行时压缩；
+        # 内容未变化且 .gz 已存在时跳过（压缩是整条流水线里最贵的一步）
+        if html_bytes != old_bytes or not os.path.exists(OUTPUT_HTML + ".gz"):
+            with open(OUTPUT_HTML + ".gz", "wb") as f:
+                # mtime=0 使压缩结果只取决于内容，重复构建产物字节一致
+                with gzip.GzipFile(fileobj=f, mode="wb", compresslevel=9, mtime=0) as gz:
+                    gz.write(html_bytes)
         print(f"\n成功生成 HTML 文件：{os.path.abspath(OUTPUT_HTML)}")
         print(f"统计信息：共 {total_topics} 个技术议题")
+
+        # 记录本次输入状态，供下次运行做未变化短路判断
+        os.makedirs(os.path.dirname(INDEX_HASH_PATH), exist_ok=True)
+        with open(INDEX_HASH_PATH, "w", encoding="utf-8") as f:
+            f.write(state_hash)
     except Exception as e:
         print(f"错误：生成 HTML 失败 - {str(e)}")
 